@@ -1,3 +1,6 @@
+from blackjack.models.hand import HandStatus
+
+
 class MetricTracker:
     """Class for tracking game metrics for analytics purposes."""
     
@@ -38,7 +41,7 @@ class MetricTracker:
     def process_gambler_hand(self, hand):
         """Track metrics for a played GamblerHand"""
         # Blackjacks
-        if hand.status == 'Blackjack':
+        if hand.status == HandStatus.BLACKJACK:
             self._increment_metric('gambler blackjacks')
 
         # Outcomes
@@ -59,7 +62,7 @@ class MetricTracker:
 
     def process_dealer_hand(self, hand):
         """Track metrics for a played DealerHand."""
-        if hand.status == 'Blackjack':
+        if hand.status == HandStatus.BLACKJACK:
             self._increment_metric('dealer blackjacks')
 
     def append_bankroll(self, bankroll):
@@ -32,7 +32,8 @@ def get_interactive_configuration(default):
         'gameplay': {
             'strategy': UserInputStrategy,
             'verbose': True,
-            'max_turns': None
+            'max_turns': None,
+            'pacing': 1.0
         }
     }
 
@@ -51,6 +52,7 @@ def get_simulation_configuration(bankroll, auto_wager, number_of_decks, strategy
         'gameplay': {
             'strategy': strategy,
             'verbose': False,
-            'max_turns': max_turns
+            'max_turns': max_turns,
+            'pacing': 0
         }
     }
@@ -0,0 +1,35 @@
+import numpy as np
+
+from blackjack.models.hand import HandStatus
+
+
+def settle_batch(totals, statuses, wagers, dealer_total, dealer_status):
+    """
+    Settle many played gambler hands against a single dealer hand in one vectorized pass (for batch simulation).
+
+    totals - final totals of the gambler hands
+    statuses - HandStatus values of the gambler hands
+    wagers - wagers placed on the gambler hands
+    dealer_total - final total of the dealer's hand
+    dealer_status - HandStatus of the dealer's hand
+
+    Hands are assumed to still need settling against the dealer (i.e. they were not resolved during the pre-turn),
+    so winning hands are paid 1:1. Mirrors GameController.determine_hand_outcome().
+    Return the boolean win, push and loss masks, and the net change to the gambler's bankroll.
+    """
+    totals = np.asarray(totals)
+    statuses = np.asarray(statuses)
+    wagers = np.asarray(wagers, dtype=float)
+
+    # Busted hands always lose. Otherwise, a busted dealer means a win, or else the higher total wins.
+    busted = statuses == HandStatus.BUSTED
+    if dealer_status == HandStatus.BUSTED:
+        loss = busted
+        win = ~busted
+    else:
+        loss = busted | (totals < dealer_total)
+        win = ~loss & (totals > dealer_total)
+    push = ~(win | loss)
+
+    net = np.sum(wagers[win]) - np.sum(wagers[loss])
+    return win, push, loss, net
@@ -1,16 +1,67 @@
-from collections import OrderedDict
+import sys
+from collections import deque
+from enum import IntEnum, auto
+from io import StringIO
 from time import sleep
 
 from blackjack.analytics.metric_tracker import MetricTracker
 from blackjack.exc import InsufficientBankrollError
-from blackjack.models.hand import DealerHand, GamblerHand
-from blackjack.display_utils import clear, header, money_format, pct_format
+from blackjack.models.hand import DealerHand, GamblerHand, HandStatus
+from blackjack.display_utils import CLEAR_SCREEN, banner, header, money_format, pct_format
+
+
+# Gambler hand statuses that require the dealer's turn to be played in order to settle
+NEEDS_DEALER_STATUSES = frozenset({HandStatus.DOUBLED, HandStatus.STOOD})
+
+# Hand action options (abbreviation -> action), indexed by `(can_double << 1) | can_split`. Shared, so never mutate them!
+HAND_OPTIONS = (
+    {'h': 'Hit', 's': 'Stand'},
+    {'h': 'Hit', 's': 'Stand', 'x': 'Split'},
+    {'h': 'Hit', 's': 'Stand', 'd': 'Double'},
+    {'h': 'Hit', 's': 'Stand', 'd': 'Double', 'x': 'Split'}
+)
+
+# Payout odds, parsed into (antecedent, consequent) integer ratios up front
+PAYOUT_ODDS = {
+    '1:1': (1, 1),
+    '3:2': (3, 2),
+    '2:1': (2, 1)
+}
+
+# Hand payout types, mapped to the hand attribute the payout is based on and the activity message template to log
+HAND_PAYOUTS = {
+    'winning_wager': ('wager', 'Adding winning hand payout of {} to bankroll.'),
+    'wager_reclaim': ('wager', 'Reclaiming hand wager of {}.'),
+    'winning_insurance': ('insurance', 'Adding winning insurance payout of {} to bankroll.'),
+    'insurance_reclaim': ('insurance', 'Reclaiming insurance wager of {}.')
+}
+
+
+class TurnState(IntEnum):
+    """States that a turn moves through. Each state's handler returns the next state (or None when the turn is over)."""
+
+    WAGER = auto()
+    DEAL = auto()
+    PRE_TURN = auto()
+    GAMBLER_TURN = auto()
+    DEALER_TURN = auto()
+    SETTLE = auto()
+    FINALIZE = auto()
+
+
+class UpCardClass(IntEnum):
+    """Classes of dealer up card, which determine the pre-turn flow."""
+
+    ACE = auto()
+    TEN = auto()  # Any ten-valued card
+    OTHER = auto()
 
 
 def render_after(instance_method):
     """Decorator for calling the `render()` instance method after calling an instance method."""
     def wrapper(self, *args, **kwargs):
         instance_method(self, *args, **kwargs)
+        self.table_dirty = True
         if self.verbose:
             self.render()
     return wrapper
@@ -18,7 +69,7 @@ def render_after(instance_method):
 
 class GameController:
 
-    def __init__(self, gambler, dealer, shoe, strategy, verbose=True, max_turns=None):
+    def __init__(self, gambler, dealer, shoe, strategy, verbose=True, max_turns=None, pacing=1.0):
         # Configured models from game setup
         self.gambler = gambler
         self.dealer = dealer
@@ -30,10 +81,22 @@ class GameController:
         # Turn activity log
         self.activity = []
 
+        # Queue of gambler hands waiting to be played this turn (can grow while playing via splitting)
+        self.pending_hands = deque()
+
         # Render options
         self.verbose = verbose       # Switch for printing/suppressing output
         self.hide_dealer = True      # Switch for showing/hiding the dealer's buried card during rendering
         self.dealer_playing = False  # Switch for when dealer is playing and no user actions available
+        self.pacing = pacing         # Seconds to pause between dealer actions when rendering (0 to disable)
+        self.table_dirty = False     # Whether game state has changed since the last rendering
+
+        # Static render text, built once since it never changes during a game
+        self.table_header = header('TABLE')
+        self.activity_header = header('ACTIVITY')
+        self.action_header = header('ACTION')
+        self.dealer_banner = banner(self.dealer.name)
+        self.gambler_banner = banner(self.gambler.name)
 
         # Keep track of number of turns played (and the max number of turns to play if applicable)
         self.turn = 0
@@ -42,6 +105,32 @@ class GameController:
         # Metric tracking (for analytics)
         self.metric_tracker = MetricTracker()
 
+        # Handlers for each state of a turn
+        self.turn_states = {
+            TurnState.WAGER: self.check_gambler_wager,
+            TurnState.DEAL: self.deal,
+            TurnState.PRE_TURN: self.play_pre_turn,
+            TurnState.GAMBLER_TURN: self.play_gambler_turn,
+            TurnState.DEALER_TURN: self.play_dealer_turn,
+            TurnState.SETTLE: self.settle_up,
+            TurnState.FINALIZE: self.finalize_turn
+        }
+
+        # Pre-turn handlers, keyed by (gambler has blackjack, dealer has blackjack, dealer up card class).
+        # Note that the dealer cannot have blackjack when showing an OTHER up card.
+        self.pre_turn_outcomes = {
+            (True, True, UpCardClass.ACE): self.pre_turn_push,
+            (True, False, UpCardClass.ACE): self.pre_turn_blackjack_win,
+            (False, True, UpCardClass.ACE): self.pre_turn_loss,
+            (False, False, UpCardClass.ACE): self.pre_turn_no_blackjack,
+            (True, True, UpCardClass.TEN): self.pre_turn_push,
+            (True, False, UpCardClass.TEN): self.pre_turn_blackjack_win,
+            (False, True, UpCardClass.TEN): self.pre_turn_loss,
+            (False, False, UpCardClass.TEN): self.pre_turn_no_blackjack,
+            (True, False, UpCardClass.OTHER): self.pre_turn_win,
+            (False, False, UpCardClass.OTHER): self.pre_turn_continue
+        }
+
     def play(self):
         """Main game loop that controls entire game flow."""
         # Track the starting bankroll
@@ -56,28 +145,10 @@ class GameController:
             # Initialize the activity log for the turn
             self.add_activity(f"Turn #{self.turn}")
 
-            # Vet the gambler's auto-wager against their bankroll, and ask if they would like to change their wager or cash out.
-            self.check_gambler_wager()
-            if self.gambler.auto_wager == 0:  # If they cashed out, don't play the turn. The game is over.
-                break
-
-            # Deal 2 cards from the shoe to the gambler's and the dealer's hands. Place the gambler's auto-wager on the hand.
-            self.deal()
-
-            # Carry out pre-turn flow (for blackjacks, insurance, etc).
-            self.play_pre_turn()
-            
-            # Play the gambler's turn (if necessary).
-            self.play_gambler_turn()
-
-            # Play the dealer's turn (if necessary).
-            self.play_dealer_turn()
-
-            # Settle gambler hand wins and losses.
-            self.settle_up()
-
-            # Track metrics and reset in order to proceed with the next turn.
-            self.finalize_turn()
+            # Step through the states of the turn, starting with vetting the wager, until the turn is over.
+            state = TurnState.WAGER
+            while state is not None:
+                state = self.turn_states[state]()
 
         # Render a game over message
         self.finalize_game()
@@ -107,6 +178,7 @@ class GameController:
         Pre-turn vetting of the gambler's wager.
         1. Check whether the gambler has enough bankroll to place their auto-wager. If not, set to remaining bankroll.
         2. Ask the gambler if they'd like to change their auto-wager or cash out. Allow them to do so.
+        Return the next TurnState, or None if the gambler cashed out.
         """
         # If the gambler doesn't have sufficient bankroll to place their auto-wager, set their auto-wager to their remaining bankroll.
         if not self.gambler.can_place_auto_wager():
@@ -116,6 +188,13 @@ class GameController:
         # Check whether the user wants to change their auto-wager or cash out.
         if self.strategy.wants_to_change_wager():
             self.set_new_auto_wager()
+            self.table_dirty = True
+
+        # If they cashed out, don't play the turn. The game is over.
+        if self.gambler.auto_wager == 0:
+            return None
+
+        return TurnState.DEAL
 
     def set_new_auto_wager(self):
         """Set a new auto-wager amount."""
@@ -151,8 +230,10 @@ class GameController:
         # Log it
         self.add_activity('Dealing hands.')
 
+        return TurnState.PRE_TURN
+
     def play_pre_turn(self):
-        """Carry out pre-turn flow for blackjacks and insurance."""
+        """Carry out pre-turn flow for blackjacks and insurance. Return the next TurnState."""
         # --- BLACKJACK CHECKING FOR PRE-TURN FLOW --- #
 
         # Grab the gambler's dealt hand for pre-turn processing.
@@ -166,122 +247,125 @@ class GameController:
         # Check if the dealer has blackjack, but don't display it to the gambler yet.
         dealer_has_blackjack = self.dealer.hand.is_blackjack()
 
-        # --- DEALER ACE PRE-TURN FLOW --- #
+        # Classify the dealer's up card, as it determines whether the dealer can have blackjack (and whether insurance is in play).
+        up_card = self.dealer.up_card()
+        if up_card.is_ace():
+            up_card_class = UpCardClass.ACE
+        elif up_card.is_facecard():
+            up_card_class = UpCardClass.TEN
+        else:
+            up_card_class = UpCardClass.OTHER
 
-        # Insurance comes into play if the dealer's upcard is an ace
-        if self.dealer.is_showing_ace():
+        # --- DEALER ACE PRE-TURN FLOW --- #
 
-            # Log it.
+        # Even money and insurance come into play if the dealer's up card is an ace. Taking either settles the hand here.
+        settled = False
+        if up_card_class == UpCardClass.ACE:
             self.add_activity('Dealer is showing an Ace.')
-
-            # If the gambler has blackjack, they can either take even money or let it ride.
             if gambler_has_blackjack:
-
-                if self.strategy.wants_even_money():
-                    # Pay out even money (meaning 1:1 hand wager).
-                    self.set_hand_outcome(gambler_hand, 'Even Money')
-                    self.add_activity(f"{self.gambler.name} took even money.")
-                else:
-                    if dealer_has_blackjack:
-                        # Both players have blackjack. Gambler reclaims their wager and that's all.
-                        self.set_hand_outcome(gambler_hand, 'Push')
-                        self.add_activity('Dealer has blackjack.', 'Hand is a push.')
-                    else:
-                        # Dealer does not have blackjack. Gambler has won a blackjack (which pays 3:2)
-                        self.set_hand_outcome(gambler_hand, 'Win')
-                        self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name} wins 3:2.")
-
-            # If the gambler does not have blackjack they can buy insurance.
+                settled = self.offer_even_money(gambler_hand)
             else:
-                # Gambler must have sufficient bankroll to place an insurance bet.
-                gambler_can_afford_insurance = self.gambler.can_place_insurance_wager()
-
-                if gambler_can_afford_insurance and self.strategy.wants_insurance():
-
-                    # Insurnace is a side bet that is half their wager, and pays 2:1 if dealer has blackjack.
-                    self.gambler.place_insurance_wager()
-
-                    # The turn is over if the dealer has blackjack. Otherwise, continue on to playing the hand.
-                    if dealer_has_blackjack:
-                        self.hide_dealer = False  # Show the dealer's blackjack.
-                        self.set_hand_outcome(gambler_hand, 'Insurance Win')
-                        self.add_activity('Dealer has blackjack.', f"{self.gambler.name}'s insurnace wager wins 2:1 (hand wager loses).")
-                    else:
-                        gambler_hand.lost_insurance = True
-                        self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name}'s insurance wager loses.")
-
-                # If the gambler does not (or cannot) place an insurance bet, they lose if the dealer has blackjack. Otherwise, hand continues.
-                else:
-                    # Message for players who were not offered the option to place an insurance bet to due insufficient bankroll.
-                    if not gambler_can_afford_insurance:
-                        self.add_activity('Insufficient bankroll to place insurance wager.')
-
-                    # The turn is over if the dealer has blackjack. Otherwise, continue on to playing the hand.
-                    if dealer_has_blackjack:
-                        self.hide_dealer = False
-                        self.add_activity('Dealer has blackjack.', f"{self.gambler.name} loses the hand.")
-                        self.set_hand_outcome(gambler_hand, 'Loss')
-                    else:
-                        self.add_activity('Dealer does not have blackjack.')
+                settled = self.offer_insurance(gambler_hand, dealer_has_blackjack)
 
         # --- DEALER FACE CARD PRE-TURN FLOW --- #
 
-        # If the dealer's upcard is a face card, insurance is not in play but need to check if the dealer has blackjack.
-        elif self.dealer.is_showing_face_card():
-
-            # Log the blackjack check.
+        # If the dealer's up card is a face card, insurance is not in play but need to check if the dealer has blackjack.
+        elif up_card_class == UpCardClass.TEN:
             self.add_activity('Checking if the dealer has blackjack.')
 
-            # If the dealer has blackjack, it's a push if the player also has blackjack. Otherwise, the player loses.
-            if dealer_has_blackjack:
+        # --- BLACKJACK OUTCOME PRE-TURN FLOW --- #
 
-                self.hide_dealer = False
-                self.add_activity('Dealer has blackjack.')
+        # Otherwise, the outcome is fully determined by who has blackjack and what the dealer is showing.
+        if not settled:
+            self.pre_turn_outcomes[(gambler_has_blackjack, dealer_has_blackjack, up_card_class)](gambler_hand)
 
-                if gambler_has_blackjack:
-                    self.add_activity('Hand is a push.')
-                    self.set_hand_outcome(gambler_hand, 'Push')
-                else:
-                    self.add_activity(f"{self.gambler.name} loses the hand.")
-                    self.set_hand_outcome(gambler_hand, 'Loss')
+        # The gambler's turn need only be played if the hand was not resolved during the pre-turn.
+        if gambler_hand.status != HandStatus.PENDING:
+            self.add_activity(f"No turn to play for {self.gambler.name}.")
+            return TurnState.DEALER_TURN
 
-            # If dealer doesn't have blackjack, the player wins if they have blackjack. Otherwise, play the turn.
-            else:
-                self.add_activity('Dealer does not have blackjack.')
-                
-                if gambler_has_blackjack:
-                    self.add_activity(f"{self.gambler.name} wins 3:2.")
-                    self.set_hand_outcome(gambler_hand, 'Win')
+        return TurnState.GAMBLER_TURN
+
+    def offer_even_money(self, gambler_hand):
+        """Offer even money on a gambler blackjack facing a dealer Ace. Return True if it was taken (settling the hand)."""
+        if not self.strategy.wants_even_money():
+            return False
+
+        # Pay out even money (meaning 1:1 hand wager).
+        self.set_hand_outcome(gambler_hand, 'Even Money')
+        self.add_activity(f"{self.gambler.name} took even money.")
+        return True
+
+    def offer_insurance(self, gambler_hand, dealer_has_blackjack):
+        """Offer insurance to a gambler facing a dealer Ace. Return True if it was taken (settling the insurance bet)."""
+        # Gambler must have sufficient bankroll to place an insurance bet.
+        if not self.gambler.can_place_insurance_wager():
+            self.add_activity('Insufficient bankroll to place insurance wager.')
+            return False
+
+        if not self.strategy.wants_insurance():
+            return False
 
-        # --- REGULAR PRE-TURN FLOW --- #
+        # Insurance is a side bet that is half their wager, and pays 2:1 if dealer has blackjack.
+        self.gambler.place_insurance_wager()
 
-        # If the dealer's upcard is not an ace or a face card, they cannot have blackjack.
-        # If the player has blackjack here, payout 3:2 and the hand is over. Otherwise, continue with playing the hand.
+        # The turn is over if the dealer has blackjack. Otherwise, continue on to playing the hand.
+        if dealer_has_blackjack:
+            self.hide_dealer = False  # Show the dealer's blackjack.
+            self.set_hand_outcome(gambler_hand, 'Insurance Win')
+            self.add_activity('Dealer has blackjack.', f"{self.gambler.name}'s insurnace wager wins 2:1 (hand wager loses).")
         else:
-            if gambler_has_blackjack:
-                self.add_activity(f"{self.gambler.name} wins 3:2.")
-                self.set_hand_outcome(gambler_hand, 'Win')
+            gambler_hand.lost_insurance = True
+            self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name}'s insurance wager loses.")
+        return True
+
+    def pre_turn_push(self, gambler_hand):
+        """Both players have blackjack. Gambler reclaims their wager and that's all."""
+        self.hide_dealer = False
+        self.add_activity('Dealer has blackjack.', 'Hand is a push.')
+        self.set_hand_outcome(gambler_hand, 'Push')
+
+    def pre_turn_loss(self, gambler_hand):
+        """Only the dealer has blackjack. The gambler loses the hand."""
+        self.hide_dealer = False
+        self.add_activity('Dealer has blackjack.', f"{self.gambler.name} loses the hand.")
+        self.set_hand_outcome(gambler_hand, 'Loss')
+
+    def pre_turn_blackjack_win(self, gambler_hand):
+        """Only the gambler has blackjack, and the dealer was checked for it. Gambler has won a blackjack (which pays 3:2)."""
+        self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name} wins 3:2.")
+        self.set_hand_outcome(gambler_hand, 'Win')
+
+    def pre_turn_win(self, gambler_hand):
+        """Only the gambler has blackjack, and the dealer cannot have it. Gambler has won a blackjack (which pays 3:2)."""
+        self.add_activity(f"{self.gambler.name} wins 3:2.")
+        self.set_hand_outcome(gambler_hand, 'Win')
+
+    def pre_turn_no_blackjack(self, gambler_hand):
+        """Neither player has blackjack, and the dealer was checked for it. Continue on to playing the hand."""
+        self.add_activity('Dealer does not have blackjack.')
+
+    def pre_turn_continue(self, gambler_hand):
+        """Neither player has blackjack, and the dealer cannot have it. Continue on to playing the hand."""
 
     def play_gambler_turn(self):
         """Play the gambler's turn, meaning play all of the gambler's hands to completion."""
-        # Log a message that the turn is being played, or there's no need to play it.
-        if any(hand.status == 'Pending' for hand in self.gambler.hands):
-            message = f"Playing {self.gambler.name}'s turn."
-        else:
-            message = f"No turn to play for {self.gambler.name}."
-        self.add_activity(message)
-        
-        # Use a while loop due to the fact that self.hands can grow while iterating (via splitting)
-        while any(hand.status == 'Pending' for hand in self.gambler.hands):
-            hand = next(hand for hand in self.gambler.hands if hand.status == 'Pending')  # Grab the next unplayed hand
-            self.play_gambler_hand(hand)
+        # Log that the turn is being played.
+        self.add_activity(f"Playing {self.gambler.name}'s turn.")
+
+        # Seed the queue with the dealt hand. Use a while loop due to the fact that the queue can grow while playing (via splitting)
+        self.pending_hands.append(self.gambler.first_hand())
+        while self.pending_hands:
+            self.play_gambler_hand(self.pending_hands.popleft())
+
+        return TurnState.DEALER_TURN
 
     def play_gambler_hand(self, hand):
         """Play a gambler hand."""
         # Set the hand's status to 'Playing', and loop until this status changes.
-        self.set_hand_status(hand, 'Playing')
+        self.set_hand_status(hand, HandStatus.PLAYING)
 
-        while hand.status == 'Playing':
+        while hand.status == HandStatus.PLAYING:
 
             # Handle single-card hands that result from splitting
             if len(hand.cards) == 1:
@@ -291,14 +375,14 @@ class GameController:
 
                 # Check if the hand is blackjack. If it is, it's an automatic win (we know dealer doesn't have blackjack)
                 if hand.is_blackjack():
-                    self.set_hand_status(hand, 'Blackjack')
+                    self.set_hand_status(hand, HandStatus.BLACKJACK)
                     self.set_hand_outcome(hand, 'Win')
                     break
 
                 # Split Aces only get 1 more card by rule. If they're not a blackjack mark them as stood.
                 if hand.cards[0].is_ace():
-                    if hand.status != 'Blackjack':
-                        self.set_hand_status(hand, 'Stood')
+                    if hand.status != HandStatus.BLACKJACK:
+                        self.set_hand_status(hand, HandStatus.STOOD)
                     break
 
             # Get the possible options for hand action to take.
@@ -311,7 +395,7 @@ class GameController:
                 self.hit_hand(hand)  # Deal another card and keep playing the hand.
 
             elif action == 'Stand':
-                self.set_hand_status(hand, 'Stood')  # Do nothing, hand is played.
+                self.set_hand_status(hand, HandStatus.STOOD)  # Do nothing, hand is played.
 
             elif action == 'Double':
                 self.double_hand(hand)  # Double the wager and deal another card. Hand is played.
@@ -324,45 +408,41 @@ class GameController:
 
             # If the hand is 21 or busted, the hand is done being played.
             if hand.is_21():
-                self.set_hand_status(hand, 'Stood')
+                self.set_hand_status(hand, HandStatus.STOOD)
             elif hand.is_busted():
-                self.set_hand_status(hand, 'Busted')
+                self.set_hand_status(hand, HandStatus.BUSTED)
                 self.set_hand_outcome(hand, 'Loss')
 
     def get_hand_options(self, hand):
         """Get the options (available actions) that can be taken on a hand."""
-        # Default options that are always available
-        options = OrderedDict([('h', 'Hit'), ('s', 'Stand')])
-
-        # Add the option to double if applicable
-        if hand.is_doubleable() and self.gambler.can_place_wager(hand.wager):
-            options['d'] = 'Double'
+        # Hit and Stand are always available. Doubling and splitting both require matching the hand's wager.
+        if not self.gambler.can_place_wager(hand.wager):
+            return HAND_OPTIONS[0]
 
-        # Add the option to split if applicable
-        if hand.is_splittable() and self.gambler.can_place_wager(hand.wager):
-            options['x'] = 'Split'
-
-        return options
+        can_double = hand.is_doubleable()
+        can_split = hand.is_splittable()
+        return HAND_OPTIONS[(can_double << 1) | can_split]
 
     @render_after
     def hit_hand(self, hand):
         """Add a card to a hand from the shoe."""
         card = self.shoe.deal_card()  # Deal a card
-        hand.cards.append(card)  # Add the card to the hand
+        hand.add_card(card)  # Add the card to the hand
 
     @render_after
     def split_hand(self, hand):
         """Split a hand."""
-        split_card = hand.cards.pop(1)  # Pop the second card off the hand to make a new hand
+        split_card = hand.pop_card(1)  # Pop the second card off the hand to make a new hand
         new_hand = GamblerHand(cards=[split_card], hand_number=len(self.gambler.hands) + 1)  # TODO: Do away with hand_number
         self.gambler.place_hand_wager(hand.wager, new_hand)  # Place the same wager on the new hand
         self.gambler.hands.append(new_hand)  # Add the hand to the gambler's list of hands
+        self.pending_hands.append(new_hand)  # Queue the new hand to be played
 
     def double_hand(self, hand):
         """Double a hand, meaning double the wager on it and hit it with one more card."""
         self.gambler.place_hand_wager(hand.wager, hand)  # Double the wager on the hand
         self.hit_hand(hand)  # Add another card to the hand from the shoe
-        self.set_hand_status(hand, 'Doubled')  # Set the status to Doubled
+        self.set_hand_status(hand, HandStatus.DOUBLED)  # Set the status to Doubled
 
     @render_after
     def set_hand_status(self, hand, status):
@@ -373,19 +453,20 @@ class GameController:
     def set_hand_outcome(self, hand, outcome):
         """Set the outcome of the hand, and change the status if applicable."""
         hand.outcome = outcome        
-        if hand.status == 'Pending':
-            hand.status = 'Played'
+        if hand.status == HandStatus.PENDING:
+            hand.status = HandStatus.PLAYED
 
     def play_dealer_turn(self):
-        """Play the dealer's turn (if necessary)."""
+        """Play the dealer's turn (if necessary). Return the next TurnState."""
         # Toggle dealer display options
         self.hide_dealer = False
         self.dealer_playing = True
+        self.table_dirty = True
 
         # The dealer's turn need only be played if there are gambler hands that are still active
-        if not any(hand.status in ('Doubled', 'Stood') for hand in self.gambler.hands):
+        if not any(hand.status in NEEDS_DEALER_STATUSES for hand in self.gambler.hands):
             self.dealer_playing = False
-            return
+            return TurnState.SETTLE
 
         self.add_activity("Playing the Dealer's turn.")
 
@@ -393,13 +474,13 @@ class GameController:
         hand = self.dealer.hand
 
         # Set the hand's status to 'Playing', and loop until this status changes.
-        self.set_hand_status(hand, 'Playing')
+        self.set_hand_status(hand, HandStatus.PLAYING)
         
-        while hand.status == 'Playing':
+        while hand.status == HandStatus.PLAYING:
 
             # Pause for user to follow along if applicable
-            if self.verbose:
-                sleep(1)
+            if self.verbose and self.pacing:
+                sleep(self.pacing)
 
             # Get the hand total.
             total = hand.final_total()
@@ -410,14 +491,17 @@ class GameController:
             
             # Dealer stands at 17 and above.
             else:
-                self.set_hand_status(hand, 'Stood')
+                self.set_hand_status(hand, HandStatus.STOOD)
 
             # If the hand is busted dealer is done playing.
             if hand.is_busted():
-                self.set_hand_status(hand, 'Busted')
+                self.set_hand_status(hand, HandStatus.BUSTED)
 
         # Mark the dealer's turn as finished.
         self.dealer_playing = False
+        self.table_dirty = True
+
+        return TurnState.SETTLE
 
     def pay_out_hand(self, hand, payout_type):
         """Pay out hand winnings, including wager reclaim."""
@@ -445,32 +529,19 @@ class GameController:
             raise ValueError(f"Invalid payout type: '{payout_type}'")
 
     def perform_hand_payout(self, hand, payout_type, odds=None):
-        """Determine hand winnings and execute the payout."""
-        # Validate args passed in
-        if payout_type in ('winning_wager', 'winning_insurance'):
-            assert odds, 'Must specify odds for wager and insurance payouts!'
-            antecedent, consequent = map(int, odds.split(':'))
-        
-        # Determine the payout amount by the payout_type (and odds if applicable)
-        if payout_type == 'winning_wager':
-            amount = hand.wager * antecedent / consequent
-            message = f"Adding winning hand payout of {money_format(amount)} to bankroll."
-        
-        elif payout_type == 'wager_reclaim':
-            amount = hand.wager
-            message = f"Reclaiming hand wager of {money_format(amount)}."
-        
-        elif payout_type == 'winning_insurance':
-            amount = hand.insurance * antecedent / consequent
-            message = f"Adding winning insurance payout of {money_format(amount)} to bankroll."
-        
-        elif payout_type == 'insurance_reclaim':
-            amount = hand.insurance
-            message = f"Reclaiming insurance wager of {money_format(amount)}."
-
-        else:
+        """Determine hand winnings and execute the payout. Odds only apply to winning (non-reclaim) payout types."""
+        try:
+            attribute, message = HAND_PAYOUTS[payout_type]
+        except KeyError:
             raise ValueError(f"Invalid payout type: '{payout_type}'")
 
+        # Determine the payout amount from the wager the payout type is based on (and the odds if applicable)
+        amount = getattr(hand, attribute)
+        if odds:
+            antecedent, consequent = PAYOUT_ODDS[odds]
+            amount = amount * antecedent / consequent
+        message = message.format(money_format(amount))
+
         hand.earnings += amount
         self.gambler.payout(amount)
         self.add_activity(f"Hand {hand.hand_number}: {message}")
@@ -478,11 +549,11 @@ class GameController:
     def determine_hand_outcome(self, hand, dealer_hand):
         """Determine a hand's outcome against a dealer hand if it is not yet known."""
         # If the hand is busted it's a loss
-        if hand.status == 'Busted':
+        if hand.status == HandStatus.BUSTED:
             self.set_hand_outcome(hand, 'Loss')
 
         # If the hand is not busted and the dealer's hand is busted it's a win
-        elif dealer_hand.status == 'Busted':
+        elif dealer_hand.status == HandStatus.BUSTED:
             self.set_hand_outcome(hand, 'Win')
 
         # If neither gambler nor dealer hand is busted, compare totals to determine wins and losses.
@@ -505,7 +576,7 @@ class GameController:
 
         # Perform payout based on the hand outcome
         if hand.outcome == 'Win':
-            if hand.status == 'Blackjack':
+            if hand.status == HandStatus.BLACKJACK:
                 self.pay_out_hand(hand, 'blackjack')
             else:
                 self.pay_out_hand(hand, 'wager')
@@ -526,10 +597,12 @@ class GameController:
             raise ValueError(f"Unhandled hand outcome: {hand.outcome}")
 
     def settle_up(self):
-        """For each of the gambler's hands, settle wagers against the dealer's hand."""
+        """For each of the gambler's hands, settle wagers against the dealer's hand. Return the next TurnState."""
         for hand in self.gambler.hands:
             self.settle_hand(hand)
 
+        return TurnState.FINALIZE
+
     def track_metrics(self):
         """Update the tracked metrics with the current turn's data."""
         # Track gambler hand metrics
@@ -543,8 +616,8 @@ class GameController:
         self.metric_tracker.append_bankroll(self.gambler.bankroll)
 
     def finalize_turn(self):
-        """Clean up the current turn in preparation for the next turn."""
-        # Render the final status of the turn if applicable.
+        """Clean up the current turn in preparation for the next turn. Return None, as the turn is over."""
+        # Render the final status of the turn if applicable (and not already rendered).
         if self.verbose:
             self.render()
         
@@ -563,7 +636,9 @@ class GameController:
 
         # Pause exectution until the user wants to proceed if applicable.
         if self.verbose:
-            input('Push ENTER to proceed => ')
+            self.strategy.wait_to_proceed()
+
+        return None
 
     def finalize_game(self):
         """Wrap up the game, rendering analytics and creating graphs if necessary."""
@@ -573,44 +648,51 @@ class GameController:
         
     def render(self):
         """Print out the entire game (comprised of table, activity log, and user action) to the console."""
-        clear()  # Clear previous rendering
-        self.render_table()
-        self.render_activity()
-        self.render_action()
-
-    def render_table(self):
+        # Nothing to redraw if the game state hasn't changed since the last rendering.
+        if not self.table_dirty:
+            return
+        self.table_dirty = False
+
+        # Build the whole frame (starting by clearing the previous rendering) and write it out in one go.
+        frame = StringIO()
+        frame.write(CLEAR_SCREEN)
+        self.render_table(frame)
+        self.render_activity(frame)
+        self.render_action(frame)
+        sys.stdout.write(frame.getvalue())
+        sys.stdout.flush()
+
+    def render_table(self, out):
         """Print out the players and the hands of cards (if they've been dealt)."""
-        print(header('TABLE'))
+        print(self.table_header, file=out)
         
         # Print the dealer's hand. If `hide_dealer` is True, don't factor in the dealer's buried card.
-        num_dashes = len(self.dealer.name) + 6
-        print(f"{'-'*num_dashes}\n   {self.dealer.name.upper()}   \n{'-'*num_dashes}\n")
+        print(self.dealer_banner, file=out)
         if self.dealer.hand:
-            print(self.dealer.hand.pretty_format(hide=self.hide_dealer))
+            print(self.dealer.hand.pretty_format(hide=self.hide_dealer), file=out)
         else:
-            print('No hand.')
+            print('No hand.', file=out)
 
         # Print the gambler's hand(s)
-        num_dashes = len(self.gambler.name) + 6
-        print(f"\n{'-'*num_dashes}\n   {self.gambler.name.upper()}   \n{'-'*num_dashes}\n\nBankroll: {money_format(self.gambler.bankroll)}  |  Auto-Wager: {money_format(self.gambler.auto_wager)}\n")
+        print(f"\n{self.gambler_banner}\nBankroll: {money_format(self.gambler.bankroll)}  |  Auto-Wager: {money_format(self.gambler.auto_wager)}\n", file=out)
         if self.gambler.hands:
             for hand in self.gambler.hands:
-                print(hand.pretty_format())
-                print()
+                print(hand.pretty_format(), file=out)
+                print(file=out)
         else:
-            print('No hands.')
+            print('No hands.', file=out)
 
-    def render_activity(self):
+    def render_activity(self, out):
         """Print out the activity log for the current turn."""
-        print(header('ACTIVITY'))
+        print(self.activity_header, file=out)
         for message in self.activity:
-            print(message)
+            print(message, file=out)
 
-    def render_action(self):
+    def render_action(self, out):
         """Print out the action section that the user interacts with."""
-        print(header('ACTION'))
+        print(self.action_header, file=out)
         if self.dealer_playing:
-            print('Dealer playing turn...')
+            print('Dealer playing turn...', file=out)
 
     def render_game_over(self):
         """Print out a final summary message once the game has ended."""
@@ -1,4 +1,9 @@
 import os
+import sys
+
+
+# ANSI escape sequence to move the cursor home and clear the terminal screen
+CLEAR_SCREEN = '\x1b[H\x1b[2J'
 
 
 def header(text):
@@ -6,14 +11,23 @@ def header(text):
     return f"\n♠️  ♥️  ♣️  ♦️   {text}  ♦️  ♣️  ♥️  ♠️\n"
 
 
-def clear(): 
-    """Clear the terminal screen (operating system dependent)."""
-    # Windows 
+def banner(name):
+    """Get a player's name, upper-cased and boxed in by dashes, to head their section of the table."""
+    num_dashes = len(name) + 6
+    return f"{'-'*num_dashes}\n   {name.upper()}   \n{'-'*num_dashes}\n"
+
+
+def enable_ansi_escapes():
+    """Enable processing of ANSI escape sequences in the terminal (only needed on Windows). Call once at startup."""
+    # Running any shell command turns on VT processing for the Windows console
     if os.name == 'nt':
-        os.system('cls') 
-    # Mac/Linux 
-    else: 
-        os.system('clear')
+        os.system('')
+
+
+def clear():
+    """Clear the terminal screen (with an ANSI escape sequence, rather than spawning a `clear`/`cls` process)."""
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
 
 def money_format(money):
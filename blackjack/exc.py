@@ -11,3 +11,8 @@ class InsufficientBankrollError(Error):
 class OverdraftError(Error):
     """Custom exception to raise when a player's bankroll attempts to go below zero."""
     pass
+
+
+class ScriptExhaustedError(Error):
+    """Custom exception to raise when a scripted strategy runs out of responses to give."""
+    pass
@@ -16,6 +16,7 @@ def setup_game(config):
     strategy = config['gameplay']['strategy']
     verbose = config['gameplay']['verbose']
     max_turns = config['gameplay']['max_turns']
+    pacing = config['gameplay']['pacing']
 
     # Create core components of the game: A Gambler, a Dealer, and a Shoe of cards.
     gambler = Gambler(name, bankroll=bankroll, auto_wager=auto_wager)
@@ -23,4 +24,4 @@ def setup_game(config):
     shoe = Shoe(number_of_decks)
 
     # Instantiate and return the central controller of the game.
-    return GameController(gambler, dealer, shoe, strategy(), verbose=verbose, max_turns=max_turns)
+    return GameController(gambler, dealer, shoe, strategy(), verbose=verbose, max_turns=max_turns, pacing=pacing)
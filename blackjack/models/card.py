@@ -1,5 +1,7 @@
 class Card:
 
+    __slots__ = ('suit', 'name', 'value')
+
     SUITS = ['Spades', 'Hearts', 'Clubs', 'Diamonds']
     RANKS = [
         ('Ace', [1, 11]),
@@ -1,5 +1,7 @@
 class Dealer:
 
+    __slots__ = ('name', 'hand')
+
     def __init__(self, hand=None):
         self.name = 'Dealer'
         self.hand = hand
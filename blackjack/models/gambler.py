@@ -4,6 +4,8 @@ from blackjack.display_utils import money_format
 
 class Gambler:
 
+    __slots__ = ('name', 'bankroll', 'auto_wager', 'hands')
+
     def __init__(self, name, bankroll=0, auto_wager=0, hands=None):
         self.name = name
         self.bankroll = bankroll
@@ -14,8 +16,8 @@ class Gambler:
         return f"Player: {self.name} | Bankroll: {money_format(self.bankroll)}"
 
     def discard_hands(self):
-        """Reset hands list."""
-        self.hands = []
+        """Reset hands list (in place, so the list is reused from turn to turn)."""
+        self.hands.clear()
 
     def is_finished(self):
         """Check if the gambler is finished playhing."""
@@ -72,7 +74,7 @@ class Gambler:
     def place_insurance_wager(self):
         """Place an insurance wager on the first hand."""
         insurance_amount = self._insurance_wager_amount()
-        if self.can_place_insurance_wager():
+        if self.can_place_wager(insurance_amount):
             self._subtract_bankroll(insurance_amount)
             self.first_hand().insurance = insurance_amount
         else:
@@ -1,14 +1,41 @@
+from enum import IntEnum, auto
+
 from blackjack.display_utils import money_format
 
 
+class HandStatus(IntEnum):
+    """Lifecycle statuses of a Hand (IntEnum so hot-path comparisons are cheap integer compares)."""
+
+    PENDING = auto()
+    PLAYING = auto()
+    PLAYED = auto()
+    STOOD = auto()
+    DOUBLED = auto()
+    BUSTED = auto()
+    BLACKJACK = auto()
+
+    def __str__(self):
+        return self.name.title()
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+# Statuses for which a hand is still being played (multiple possible totals are displayed)
+ACTIVE_STATUSES = frozenset({HandStatus.PENDING, HandStatus.PLAYING})
+
+
 class Hand:
 
-    def __init__(self, cards=None, status='Pending'):
+    __slots__ = ('cards', 'status', '_totals')
+
+    def __init__(self, cards=None, status=HandStatus.PENDING):
         self.cards = cards or []  # Card order matters for consistent display
         self.status = status
+        self._totals = None  # Cached result of possible_totals(), reset whenever the cards change
 
         if self.is_blackjack():
-            self.status = 'Blackjack'
+            self.status = HandStatus.BLACKJACK
 
     def __str__(self):
         return ' | '.join(str(card) for card in self.cards)
@@ -16,7 +43,24 @@ class Hand:
     def __repr__(self):
         return self.__str__()
 
+    def add_card(self, card):
+        """Add a card to the hand."""
+        self.cards.append(card)
+        self._totals = None
+
+    def pop_card(self, index=-1):
+        """Remove a card from the hand and return it."""
+        card = self.cards.pop(index)
+        self._totals = None
+        return card
+
     def possible_totals(self):
+        """Get the possible hand totals, computing them only if the cards have changed since last time."""
+        if self._totals is None:
+            self._totals = self._compute_possible_totals()
+        return self._totals
+
+    def _compute_possible_totals(self):
         """Sum the cards in the hand. Return 2 totals, due to the dual value of Aces."""
         # Get the number of aces in the hand
         num_aces = self.get_num_aces_in_hand()
@@ -67,7 +111,7 @@ class Hand:
     def get_total_to_display(self):
         """Get the hand total to display contingent on hand status."""
         # If hand is still active, allow for multiple totals to be displayed. Otherwise, display the single final total.
-        if self.status in ('Pending', 'Playing'):
+        if self.status in ACTIVE_STATUSES:
             return self.format_possible_totals()
         else:
             return str(self.final_total())
@@ -92,7 +136,9 @@ class Hand:
 
 class GamblerHand(Hand):
 
-    def __init__(self, cards=None, status='Pending', wager=0, insurance=0, hand_number=1):
+    __slots__ = ('wager', 'insurance', 'hand_number', 'outcome', 'earnings', 'lost_insurance')
+
+    def __init__(self, cards=None, status=HandStatus.PENDING, wager=0, insurance=0, hand_number=1):
         super().__init__(cards, status)
         # Attributes
         self.wager = wager
@@ -143,6 +189,8 @@ class GamblerHand(Hand):
 
 class DealerHand(Hand):
 
+    __slots__ = ()
+
     def up_card(self):
         return self.cards[0]
 
@@ -23,3 +23,6 @@ class BaseStrategy(ABC):
     @abstractmethod
     def wants_insurance(self):
         """Get a yes/no response (bool) for whether a user wants to make an insurance bet when facing an Ace."""
+
+    def wait_to_proceed(self):
+        """Block until the gambler is ready to proceed to the next turn. By default, don't wait at all."""
@@ -0,0 +1,44 @@
+from collections import deque
+
+from blackjack.exc import ScriptExhaustedError
+from blackjack.strategies.base_strategy import BaseStrategy
+
+
+class ScriptedStrategy(BaseStrategy):
+    """
+    Strategy that makes decisions by replaying a predetermined sequence of responses, in the order they're asked for.
+    Useful for playing out a specific game headlessly (no user input required).
+
+    Responses are the values the other strategies would return (bool, float), except for hand actions, which are
+    given as option abbreviations (e.g. 'h', 's') just as a user would type them.
+    """
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = deque(responses)
+
+    def _next_response(self):
+        """Get the next scripted response."""
+        if not self.responses:
+            raise ScriptExhaustedError('Scripted strategy has no responses left')
+        return self.responses.popleft()
+
+    def wants_to_change_wager(self):
+        """Get a yes/no response (bool) for whether the gambler wants to change their auto-wager."""
+        return self._next_response()
+
+    def get_new_auto_wager(self):
+        """Get a new auto-wager amount (float)."""
+        return self._next_response()
+
+    def get_hand_action(self, hand, options, dealer_upcard):
+        """Get the action to take on the hand ('Hit', 'Stand', etc.)"""
+        return options[self._next_response()]
+
+    def wants_even_money(self):
+        """Get a yes/no response (bool) for whether a the gambler wants to take even money for a blackjack when facing an Ace."""
+        return self._next_response()
+
+    def wants_insurance(self):
+        """Get a yes/no response (bool) for whether a user wants to make an insurance bet when facing an Ace."""
+        return self._next_response()
@@ -31,7 +31,7 @@ class UserInputStrategy(BaseStrategy):
         Get the action to take on the hand ('Hit', 'Stand', etc.).
         
         hand - GamblerHand instance
-        options - OrderedDict of possible actions like: {'h': 'Hit', 's': 'Stand' ... }
+        options - dict of possible actions like: {'h': 'Hit', 's': 'Stand' ... }
         dealer_upcard - Card instance dealer is showing (applicable to other InputControllers)
         """
         # Formatted options to display to the user
@@ -55,3 +55,8 @@ class UserInputStrategy(BaseStrategy):
     def wants_insurance():
         """Get a yes/no response (bool) for whether a user wants to make an insurance bet when facing an Ace."""
         return get_user_input("Insurance? (y/n) => ", yes_no_response)
+
+    @staticmethod
+    def wait_to_proceed():
+        """Block until the user is ready to proceed to the next turn."""
+        input('Push ENTER to proceed => ')
@@ -4,7 +4,7 @@ from argparse import ArgumentParser
 
 from blackjack.analytics.single_game_analyzer import SingleGameAnalyzer
 from blackjack.configuration import get_interactive_configuration
-from blackjack.display_utils import clear, header
+from blackjack.display_utils import clear, enable_ansi_escapes, header
 from blackjack.game_setup import setup_game
 
 
@@ -15,7 +15,8 @@ if __name__ == '__main__':
     parser.add_argument('-d', '--default', help='Use the default game setup instead of manually configuring', action='store_true')
     args = parser.parse_args()
 
-    # Clear the terminal screen.
+    # Enable ANSI escape sequences and clear the terminal screen.
+    enable_ansi_escapes()
     clear()
 
     # Load the game configuration (in this case, the 'interactive' configuration).
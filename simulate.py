@@ -7,7 +7,7 @@ from tqdm import tqdm
 
 from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
 from blackjack.configuration import get_simulation_configuration
-from blackjack.display_utils import clear, header
+from blackjack.display_utils import clear, enable_ansi_escapes, header
 from blackjack.game_setup import setup_game
 from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
 from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
@@ -38,7 +38,8 @@ if __name__ == '__main__':
     parser.add_argument('-t', '--turns', help='Max number of turns to play per game', type=int, default=100)
     args = parser.parse_args()
 
-    # Clear the terminal screen.
+    # Enable ANSI escape sequences and clear the terminal screen.
+    enable_ansi_escapes()
     clear()
 
     # Get the requested gameplay strategy